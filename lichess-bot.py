@@ -244,6 +244,7 @@ def play_game(li, game_id, control_queue, engine_factory, user_profile, config,
 
     first_move = True
     correspondence_disconnect_time = 0
+    board = None
     while not terminated:
         try:
             if first_move:
@@ -258,7 +259,7 @@ def play_game(li, game_id, control_queue, engine_factory, user_profile, config,
                 conversation.react(ChatLine(upd), game)
             elif u_type == "gameState":
                 game.state = upd
-                board = setup_board(game)
+                board = setup_board(game, board)
                 if not is_game_over(game) and is_engine_move(game, board):
                     start_time = time.perf_counter_ns()
                     fake_thinking(config, board, game)
@@ -388,8 +389,14 @@ def print_move_number(board):
     logger.info("move: {}".format(len(board.move_stack) // 2 + 1))
 
 
-def setup_board(game):
-    if game.variant_name.lower() == "chess960":
+def setup_board(game, board=None):
+    moves = game.state["moves"].split()
+    # Reuse the board from the previous update if the game has only moved on from it,
+    # instead of parsing the initial position and replaying the whole game again.
+    if board is not None and len(board.move_stack) <= len(moves) and all(
+            move.uci() == uci for move, uci in zip(board.move_stack, moves)):
+        moves = moves[len(board.move_stack):]
+    elif game.variant_name.lower() == "chess960":
         board = chess.Board(game.initial_fen, chess960=True)
     elif game.variant_name == "From Position":
         board = chess.Board(game.initial_fen)
@@ -397,11 +404,12 @@ def setup_board(game):
         VariantBoard = find_variant(game.variant_name)
         board = VariantBoard()
 
-    for move in game.state["moves"].split():
+    for move in moves:
         try:
             board.push_uci(move)
         except ValueError as e:
-            logger.debug("Ignoring illegal move {} on board {} ({})".format(move, board.fen(), e))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Ignoring illegal move %s on board %s (%s)", move, board.fen(), e)
 
     return board
 